@@ -145,12 +145,10 @@ public class AuthenticationSettingsRenderTests
                 height: window.innerHeight
             };
 
-            function isElementVisible(el) {
-                const style = window.getComputedStyle(el);
+            function isElementVisible(el, rect, style) {
                 if (style.display === 'none' || style.visibility === 'hidden') return false;
                 if (parseFloat(style.opacity) === 0) return false;
 
-                const rect = el.getBoundingClientRect();
                 return rect.width > 0 && rect.height > 0;
             }
 
@@ -179,7 +177,7 @@ public class AuthenticationSettingsRenderTests
                         position: style.position,
                         zIndex: style.zIndex
                     },
-                    isVisible: isElementVisible(el),
+                    isVisible: isElementVisible(el, rect, style),
                     classes: Array.from(el.classList)
                 };
             }
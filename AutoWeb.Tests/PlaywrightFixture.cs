@@ -1,6 +1,9 @@
 using System;
 using System.Diagnostics;
+using System.Net;
 using System.Net.Http;
+using System.Net.Sockets;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Playwright;
 using Xunit;
@@ -28,6 +31,11 @@ public class PlaywrightFixture : IAsyncLifetime
         // Kill any existing process on our port
         KillProcessOnPort(AutoWebPort);
 
+        if (!await WaitForPortFreeAsync(AutoWebPort, TimeSpan.FromSeconds(5)))
+        {
+            throw new Exception($"Port {AutoWebPort} still in use after 5s; cannot start AutoWeb on {BaseUrl}");
+        }
+
         // Start AutoWeb
         var autoWebDir = System.IO.Path.GetFullPath(System.IO.Path.Combine(
             System.IO.Path.GetDirectoryName(typeof(PlaywrightFixture).Assembly.Location) ?? "",
@@ -48,19 +56,35 @@ public class PlaywrightFixture : IAsyncLifetime
             }
         };
 
+        // Drain redirected output as it arrives so a full pipe can't stall the server
+        _autoWebProcess.OutputDataReceived += (_, e) =>
+        {
+            if (e.Data != null) Console.WriteLine($"    {e.Data}");
+        };
+        _autoWebProcess.ErrorDataReceived += (_, e) =>
+        {
+            if (e.Data != null) Console.Error.WriteLine($"    {e.Data}");
+        };
+
         _autoWebProcess.Start();
+        _autoWebProcess.BeginOutputReadLine();
+        _autoWebProcess.BeginErrorReadLine();
 
         // Wait for server to start
         var startTime = DateTime.UtcNow;
         var timeout = TimeSpan.FromSeconds(30);
         var ready = false;
+        var delay = TimeSpan.FromMilliseconds(50);
+        var maxDelay = TimeSpan.FromSeconds(1);
+
+        // Reuse one client so probes share a keep-alive connection
+        using var client = new HttpClient { Timeout = TimeSpan.FromSeconds(2) };
 
         while (DateTime.UtcNow - startTime < timeout)
         {
             try
             {
-                using var client = new HttpClient();
-                var response = await client.GetAsync(BaseUrl);
+                using var response = await client.GetAsync(BaseUrl);
                 if (response.IsSuccessStatusCode)
                 {
                     ready = true;
@@ -72,7 +96,9 @@ public class PlaywrightFixture : IAsyncLifetime
                 // Still starting
             }
 
-            await Task.Delay(500);
+            // Probe often while a fast start is likely, then back off
+            await Task.Delay(delay);
+            delay = TimeSpan.FromMilliseconds(Math.Min(maxDelay.TotalMilliseconds, delay.TotalMilliseconds * 1.5));
         }
 
         if (!ready)
@@ -93,6 +119,14 @@ public class PlaywrightFixture : IAsyncLifetime
     }
 
     public async Task DisposeAsync()
+    {
+        // Browser and server teardown are independent, so overlap them
+        await Task.WhenAll(CloseBrowserAsync(), StopAutoWebAsync());
+
+        Console.WriteLine("PlaywrightFixture cleanup complete");
+    }
+
+    private async Task CloseBrowserAsync()
     {
         if (Browser != null)
         {
@@ -101,14 +135,32 @@ public class PlaywrightFixture : IAsyncLifetime
         }
 
         _playwright?.Dispose();
+    }
+
+    private async Task StopAutoWebAsync()
+    {
+        if (_autoWebProcess == null)
+        {
+            return;
+        }
 
-        if (_autoWebProcess != null && !_autoWebProcess.HasExited)
+        if (!_autoWebProcess.HasExited)
         {
             _autoWebProcess.Kill(entireProcessTree: true);
-            _autoWebProcess.Dispose();
+
+            // Bounded wait so the port is released before the next run's KillProcessOnPort
+            using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(3));
+            try
+            {
+                await _autoWebProcess.WaitForExitAsync(cts.Token);
+            }
+            catch (OperationCanceledException)
+            {
+                Console.WriteLine("AutoWeb did not exit within 3s of kill");
+            }
         }
 
-        Console.WriteLine("PlaywrightFixture cleanup complete");
+        _autoWebProcess.Dispose();
     }
 
     private void KillProcessOnPort(int port)
@@ -120,7 +172,7 @@ public class PlaywrightFixture : IAsyncLifetime
                 StartInfo = new ProcessStartInfo
                 {
                     FileName = "lsof",
-                    Arguments = $"-ti:{port}",
+                    Arguments = $"-ti:{port} -sTCP:LISTEN",
                     RedirectStandardOutput = true,
                     UseShellExecute = false
                 }
@@ -133,9 +185,16 @@ public class PlaywrightFixture : IAsyncLifetime
             {
                 foreach (var pid in output.Split('\n', StringSplitOptions.RemoveEmptyEntries))
                 {
-                    Process.Start("kill", $"-9 {pid}");
+                    try
+                    {
+                        using var listener = Process.GetProcessById(int.Parse(pid));
+                        listener.Kill();
+                    }
+                    catch (ArgumentException)
+                    {
+                        // Already exited
+                    }
                 }
-                System.Threading.Thread.Sleep(1000);
             }
         }
         catch
@@ -143,4 +202,48 @@ public class PlaywrightFixture : IAsyncLifetime
             // Ignore errors
         }
     }
+
+    private static async Task<bool> WaitForPortFreeAsync(int port, TimeSpan timeout)
+    {
+        var deadline = DateTime.UtcNow + timeout;
+
+        while (DateTime.UtcNow < deadline)
+        {
+            // Kestrel binds "localhost" on both 127.0.0.1 and [::1], so both must be free
+            if (IsPortFree(IPAddress.Loopback, port) && IsPortFree(IPAddress.IPv6Loopback, port))
+            {
+                return true;
+            }
+
+            await Task.Delay(50);
+        }
+
+        return false;
+    }
+
+    private static bool IsPortFree(IPAddress address, int port)
+    {
+        TcpListener? listener = null;
+        try
+        {
+            // The constructor creates the socket, so it throws here when the OS has no IPv6
+            listener = new TcpListener(address, port);
+            listener.Start();
+            return true;
+        }
+        catch (SocketException ex) when (ex.SocketErrorCode is SocketError.AddressFamilyNotSupported or SocketError.AddressNotAvailable)
+        {
+            // No IPv6 on this host, so nothing can hold the port there
+            return true;
+        }
+        catch (SocketException)
+        {
+            // Still held by the killed process
+            return false;
+        }
+        finally
+        {
+            listener?.Stop();
+        }
+    }
 }